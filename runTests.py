@@ -1,5 +1,7 @@
 
 import sys, string, os
+import shutil
+import tempfile
 import argparse
 import subprocess
 import StringIO
@@ -245,6 +247,17 @@ def runTest(filepath, update):
 def run(testsRootDir):
     print "======================================"
     print "Running Tests in " + testsRootDir
+
+    # Tests writing files use this folder, which is removed once the tests have run.
+    tempDir = tempfile.mkdtemp(prefix='RiggingToolboxTests')
+    os.environ['FABRIC_RIGGINGTOOLBOX_TEST_TEMP'] = tempDir
+    try:
+        runTests(testsRootDir)
+    finally:
+        shutil.rmtree(tempDir, ignore_errors=True)
+
+
+def runTests(testsRootDir):
     # Parse the commandline args.
     parser = argparse.ArgumentParser()
     parser.add_argument('--file', required=False, help = "The python or kl File to use in the test (optional)")